@@ -11,7 +11,7 @@ __author__ = "Jianxun Zhu"
 
 # Core classes
 from .core.plotspec import PlotSpec
-from .core.wavedataset import WaveDataset
+from .core.wavedataset import SignalNotFoundError, WaveDataset
 
 # Main API functions
 from .core.plotting import plot
@@ -54,6 +54,8 @@ __all__ = [
     # Core classes
     "PlotSpec",
     "WaveDataset",
+    # Exceptions
+    "SignalNotFoundError",
     # Utilities
     "set_renderer",
     "pio",  # Give users access to plotly.io
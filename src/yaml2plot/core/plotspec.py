@@ -7,11 +7,22 @@ with structured validation and type safety.
 
 from typing import List, Optional, Dict, Any, Union
 from pathlib import Path
+from functools import lru_cache
+import copy
 import yaml
 import numpy as np
 from pydantic import BaseModel, Field, ConfigDict
 import plotly.graph_objects as go
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml(yaml_str: str) -> Any:
+    """Parse a YAML string, memoized on its content; callers must not mutate."""
+    return yaml.load(yaml_str, Loader=_YamlLoader)
+
 
 class XAxisSpec(BaseModel):
     """X-axis configuration specification."""
@@ -78,12 +89,11 @@ class PlotSpec(BaseModel):
     def from_yaml(cls, yaml_str: str) -> "PlotSpec":
         """Create PlotSpec from YAML string."""
         try:
-            config_dict = yaml.safe_load(yaml_str)
-            if isinstance(config_dict, list):
-                raise ValueError("Multi-figure configurations not supported")
-            return cls.model_validate(config_dict)
+            # Copy so the cached parse result stays pristine
+            config_dict = copy.deepcopy(_parse_yaml(yaml_str))
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML: {e}")
+        return cls._from_parsed(config_dict)
 
     @classmethod
     def from_file(cls, file_path: Union[str, Path]) -> "PlotSpec":
@@ -105,11 +115,23 @@ class PlotSpec(BaseModel):
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
         try:
-            yaml_content = file_path.read_text(encoding="utf-8")
-            return cls.from_yaml(yaml_content)
+            # Let the parser read the file directly instead of via a str copy
+            with file_path.open("rb") as f:
+                try:
+                    config_dict = yaml.load(f, Loader=_YamlLoader)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"Invalid YAML: {e}")
+            return cls._from_parsed(config_dict)
         except Exception as e:
             raise ValueError(f"Failed to load configuration from {file_path}: {e}")
 
+    @classmethod
+    def _from_parsed(cls, config_dict: Any) -> "PlotSpec":
+        """Validate a parsed YAML document into a PlotSpec."""
+        if isinstance(config_dict, list):
+            raise ValueError("Multi-figure configurations not supported")
+        return cls.model_validate(config_dict)
+
     # Configuration export methods
     def to_dict(self) -> Dict[str, Any]:
         """
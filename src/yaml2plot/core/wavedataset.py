@@ -5,7 +5,7 @@ This module provides the WaveDataset class as a modern replacement for SpiceData
 with support for optional metadata and designed for the new v0.2.0 API.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import numpy as np
 from spicelib import RawRead
 
@@ -13,6 +13,41 @@ from spicelib import RawRead
 MAX_SIGNALS_TO_SHOW = 5  # Maximum number of signals to show in error messages
 
 
+class SignalNotFoundError(ValueError):
+    """
+    Raised when a requested signal is not present in a WaveDataset.
+
+    The message listing available signals is formatted only when the error is
+    rendered, so callers that catch and discard it skip that work.
+    """
+
+    def __init__(self, name: str, available: Tuple[str, ...]):
+        super().__init__(name)
+        self.name = name
+        self.available = available
+
+    def __str__(self) -> str:
+        available_signals = ", ".join(
+            self.available[:MAX_SIGNALS_TO_SHOW]
+        )  # Show first 5 in lowercase
+        if len(self.available) > MAX_SIGNALS_TO_SHOW:
+            available_signals += f", ... ({len(self.available)} total)"
+        return (
+            f"Signal '{self.name}' not found in raw file. "
+            f"Available signals: {available_signals}"
+        )
+
+
+def _read_raw_file(raw_file_path: str) -> RawRead:
+    """Read a SPICE .raw file with spicelib, wrapping errors with the file path."""
+    try:
+        return RawRead(raw_file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SPICE raw file not found: {raw_file_path}")
+    except Exception as e:
+        raise Exception(f"Failed to read SPICE raw file '{raw_file_path}': {e}")
+
+
 class WaveDataset:
     """
     A dataset container for SPICE simulation data with optional metadata.
@@ -21,6 +56,16 @@ class WaveDataset:
     signal data with metadata support for the new v0.2.0 API.
     """
 
+    __slots__ = (
+        "_raw_data",
+        "_raw_file_path",
+        "_metadata",
+        "_name_map",
+        "_signals",
+        "_trace_cache",
+        "__weakref__",
+    )
+
     def __init__(self, raw_data: RawRead, metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize WaveDataset with raw data and optional metadata.
@@ -29,8 +74,45 @@ class WaveDataset:
             raw_data: Loaded spicelib RawRead object
             metadata: Optional metadata dictionary
         """
+        self._init_state(raw_data, None, metadata)
+        self._load_names()
+
+    def _init_state(
+        self,
+        raw_data: Optional[RawRead],
+        raw_file_path: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        """Set up instance state; raw_data is None only for lazy datasets."""
         self._raw_data = raw_data
+        self._raw_file_path = raw_file_path
         self._metadata = metadata or {}
+        # Map normalized (lowercase) signal name -> original trace name, built
+        # once so lookups don't re-scan and re-lowercase the trace list per call
+        self._name_map: Optional[Dict[str, str]] = None
+        self._signals: Tuple[str, ...] = ()
+        # Materialized trace arrays keyed by normalized (lowercase) signal name
+        self._trace_cache: Dict[str, np.ndarray] = {}
+
+    @property
+    def _raw(self) -> RawRead:
+        """spicelib RawRead object, reading the file on first use if lazy."""
+        if self._raw_data is None:
+            if self._raw_file_path is None:
+                raise ValueError("WaveDataset has neither raw data nor a raw file path")
+            self._raw_data = _read_raw_file(self._raw_file_path)
+        return self._raw_data
+
+    def _load_names(self) -> Dict[str, str]:
+        """Build the lowercase -> original signal name map and signal tuple."""
+        names = self._raw.get_trace_names()
+        name_map: Dict[str, str] = {}
+        for name in names:
+            # First trace wins when names differ only by case
+            name_map.setdefault(name.lower(), name)
+        self._name_map = name_map
+        self._signals = tuple(name.lower() for name in names)
+        return name_map
 
     @property
     def signals(self) -> List[str]:
@@ -40,7 +122,9 @@ class WaveDataset:
         Returns:
             List of signal names (trace names) in lowercase
         """
-        return [name.lower() for name in self._raw_data.get_trace_names()]
+        if self._name_map is None:
+            self._load_names()
+        return list(self._signals)
 
     @property
     def metadata(self) -> Dict[str, Any]:
@@ -52,44 +136,82 @@ class WaveDataset:
         """
         return self._metadata.copy()
 
-    def get_signal(self, name: str) -> np.ndarray:
+    def get_signal(self, name: str, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Get data for a specific signal by name (case-insensitive).
 
         Args:
             name: Signal name (trace name) - case insensitive
+            out: Optional pre-allocated array to copy the signal into, so
+                 repeated reads can reuse one buffer. Must have the signal's
+                 exact shape; dtype follows NumPy "same_kind" casting rules.
 
         Returns:
-            Signal data as numpy array
+            Signal data as numpy array (``out`` itself when given). Without
+            ``out`` the array is cached and shared between calls for the same
+            signal; copy it before modifying in place.
 
         Raises:
-            ValueError: If signal name is not found
+            SignalNotFoundError: If signal name is not found (a ValueError)
+            ValueError: If ``out`` does not match the signal's shape
         """
-        # Normalize input name to lowercase
-        normalized_name = name.lower()
+        if out is None:
+            # Repeated lookups of an already-normalized name skip resolution
+            data = self._trace_cache.get(name)
+            if data is not None:
+                return data
 
-        # Find the original signal name (with original case) in the raw file
-        original_signals = self._raw_data.get_trace_names()
-        original_name = None
+        name_map = self._name_map if self._name_map is not None else self._load_names()
 
-        for signal in original_signals:
-            if signal.lower() == normalized_name:
-                original_name = signal
-                break
+        # Resolve the original signal name (with original case) in the raw file.
+        # Keys are lowercase, so try the name as given before lowercasing it.
+        key = name if name in name_map else name.lower()
+        original_name = name_map.get(key)
 
         if original_name is None:
-            available_signals = ", ".join(
-                self.signals[:MAX_SIGNALS_TO_SHOW]
-            )  # Show first 5 in lowercase
-            if len(self.signals) > MAX_SIGNALS_TO_SHOW:
-                available_signals += f", ... ({len(self.signals)} total)"
-            raise ValueError(
-                f"Signal '{name}' not found in raw file. "
-                f"Available signals: {available_signals}"
+            raise SignalNotFoundError(name, self._signals)
+
+        data = self._trace_cache.get(key)
+        if out is not None:
+            # Fill the caller's buffer without materializing a cached copy
+            source = (
+                data
+                if data is not None
+                else np.asarray(self._raw.get_trace(original_name))
             )
+            # copyto would broadcast; require an exact match instead
+            if out.shape != source.shape:
+                raise ValueError(f"out has shape {out.shape}, expected {source.shape}")
+            np.copyto(out, source)
+            return out
 
-        trace = self._raw_data.get_trace(original_name)
-        return np.array(trace)
+        if data is None:
+            # spicelib returns a TraceRead, which has no __array__, so NumPy
+            # builds a new array through its sequence protocol. dtype is left
+            # alone so complex AC traces stay complex
+            data = np.asarray(self._raw.get_trace(original_name))
+            self._trace_cache[key] = data
+        return data
+
+    def get_signals(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Get data for several signals at once (case-insensitive).
+
+        Args:
+            names: Signal names (trace names) - case insensitive
+
+        Returns:
+            Dictionary mapping each requested name to its signal data. Names
+            differing only in case share one cached array.
+
+        Raises:
+            SignalNotFoundError: If any signal name is not found (a ValueError)
+        """
+        return {name: self.get_signal(name) for name in names}
+
+    def clear_cache(self) -> None:
+        """Drop cached signal arrays so their memory can be reclaimed."""
+        self._trace_cache.clear()
 
     def has_signal(self, name: str) -> bool:
         """
@@ -101,11 +223,15 @@ class WaveDataset:
         Returns:
             True if signal exists, False otherwise
         """
-        return name.lower() in self.signals
+        name_map = self._name_map if self._name_map is not None else self._load_names()
+        return name in name_map or name.lower() in name_map
 
     @classmethod
     def from_raw(
-        cls, raw_file_path: str, metadata: Optional[Dict[str, Any]] = None
+        cls,
+        raw_file_path: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        lazy: bool = False,
     ) -> "WaveDataset":
         """
         Create WaveDataset from a SPICE .raw file.
@@ -113,6 +239,8 @@ class WaveDataset:
         Args:
             raw_file_path: Path to the SPICE .raw file
             metadata: Optional metadata dictionary
+            lazy: If True, defer reading the file until signals or signal data
+                  are first accessed. Read errors are then raised at that point.
 
         Returns:
             WaveDataset instance
@@ -121,11 +249,10 @@ class WaveDataset:
             FileNotFoundError: If the raw file doesn't exist
             Exception: If the file cannot be read by spicelib
         """
-        try:
-            raw_data = RawRead(raw_file_path)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"SPICE raw file not found: {raw_file_path}")
-        except Exception as e:
-            raise Exception(f"Failed to read SPICE raw file '{raw_file_path}': {e}")
-
-        return cls(raw_data, metadata)
+        if lazy:
+            # Bypass __init__, which requires loaded raw data
+            dataset = cls.__new__(cls)
+            dataset._init_state(None, raw_file_path, metadata)
+            return dataset
+
+        return cls(_read_raw_file(raw_file_path), metadata)
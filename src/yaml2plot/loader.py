@@ -75,14 +75,16 @@ def load_spice_raw(raw_file: _PathLike) -> xr.Dataset:
         coord_signal = signals[0]
         dim_name = 'axis'
     
+    # Read every trace in one call
+    traces = wave_data.get_signals(signals)
+
     # Add coordinate
-    coord_data = wave_data.get_signal(coord_signal)
-    coords[dim_name] = coord_data
+    coords[dim_name] = traces[coord_signal]
     
     # Add all other signals as data variables
     for signal in signals:
         if signal != coord_signal:
-            data_vars[signal] = ([dim_name], wave_data.get_signal(signal))
+            data_vars[signal] = ([dim_name], traces[signal])
     
     # Add metadata as global attributes
     attrs.update(wave_data.metadata)
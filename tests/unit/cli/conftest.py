@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def serve_dataset(monkeypatch):
+    """Make the CLI's load_spice_raw return the given xarray Dataset."""
+
+    def _serve(dataset):
+        monkeypatch.setattr(
+            "yaml2plot.cli.load_spice_raw", lambda *args, **kwargs: dataset
+        )
+
+    return _serve
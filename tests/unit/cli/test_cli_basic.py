@@ -1,5 +1,6 @@
 import numpy as np
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -11,9 +12,7 @@ import yaml2plot.cli as cli_mod
 
 class TestApplyOverrides:
     def test_only_overrides_non_none_attributes(self):
-        spec = MagicMock()
-        spec.width = 400
-        spec.height = 300
+        spec = SimpleNamespace(width=400, height=300, theme="plotly")
         # Provide some overrides (height None means keep original)
         cli_mod._apply_overrides(spec, width=800, height=None, theme="plotly_dark")
         assert spec.width == 800
@@ -2,7 +2,6 @@ import pytest
 import xarray as xr
 import numpy as np
 from click.testing import CliRunner
-from unittest.mock import patch
 from yaml2plot.cli import cli
 
 
@@ -11,8 +10,7 @@ def runner():
     return CliRunner()
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_init_command_happy_path(mock_load_spice_raw, runner):
+def test_init_command_happy_path(serve_dataset, runner):
     """Test the 'init' command with a standard raw file."""
     # Arrange - Mock xarray Dataset
     mock_dataset = xr.Dataset(
@@ -22,7 +20,7 @@ def test_init_command_happy_path(mock_load_spice_raw, runner):
         },
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -40,15 +38,14 @@ def test_init_command_happy_path(mock_load_spice_raw, runner):
         assert "# Independent variable of the simulation" in result.output
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_init_command_2_signals(mock_load_spice_raw, runner):
+def test_init_command_2_signals(serve_dataset, runner):
     """Test the 'init' command with a raw file containing 2 signals."""
     # Arrange - Mock xarray Dataset
     mock_dataset = xr.Dataset(
         data_vars={"v(out)": (["time"], np.array([]))},
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -64,15 +61,14 @@ def test_init_command_2_signals(mock_load_spice_raw, runner):
         assert 'v(in): "v(in)"' not in result.output
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_init_command_1_signal(mock_load_spice_raw, runner):
+def test_init_command_1_signal(serve_dataset, runner):
     """Test the 'init' command with a raw file containing 1 signal."""
     # Arrange - Mock xarray Dataset with only coordinate (no data vars)
     mock_dataset = xr.Dataset(
         data_vars={},
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -87,12 +83,11 @@ def test_init_command_1_signal(mock_load_spice_raw, runner):
         assert "signals: {}" in result.output
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_init_command_0_signals(mock_load_spice_raw, runner):
+def test_init_command_0_signals(serve_dataset, runner):
     """Test the 'init' command with a raw file containing 0 signals."""
     # Arrange - Mock xarray Dataset with no data vars or coordinates
     mock_dataset = xr.Dataset(data_vars={}, coords={})
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -15,6 +15,18 @@ from yaml2plot.core.plotspec import PlotSpec
 
 
 class TestCliRawFieldHandling:
+    @pytest.fixture
+    def cli_mocks(self):
+        """Patch the CLI's loader, plotter and renderer setup once per test."""
+        data_vars = {"v1": (["time"], np.array([1, 2, 3]))}
+        coords = {"time": np.array([1, 2, 3])}
+        with patch("yaml2plot.cli.load_spice_raw") as mock_load, patch(
+            "yaml2plot.cli.create_plot"
+        ) as mock_plot, patch("yaml2plot.cli.configure_plotly_renderer"):
+            mock_load.return_value = xr.Dataset(data_vars=data_vars, coords=coords)
+            mock_plot.return_value = MagicMock()
+            yield mock_load
+
     def test_plotspec_has_raw_field(self):
         """Test that PlotSpec accepts and exports raw field."""
         spec_dict = {
@@ -31,10 +43,7 @@ class TestCliRawFieldHandling:
         config = spec.to_dict()
         assert config["raw"] == "test.raw"
 
-    @patch("yaml2plot.cli.load_spice_raw")
-    @patch("yaml2plot.cli.create_plot")
-    @patch("yaml2plot.cli.configure_plotly_renderer")
-    def test_yaml_raw_field_usage(self, mock_configure, mock_plot, mock_load, tmp_path):
+    def test_yaml_raw_field_usage(self, cli_mocks, tmp_path):
         """Test using raw: field from YAML specification."""
         # Create a test spec file with raw: field
         spec_file = tmp_path / "spec.yaml"
@@ -53,26 +62,14 @@ y:
 """
         spec_file.write_text(spec_content)
 
-        # Mock the load function to return fake xarray Dataset
-        data_vars = {"v1": (["time"], np.array([1, 2, 3]))}
-        coords = {"time": np.array([1, 2, 3])}
-        mock_dataset = xr.Dataset(data_vars=data_vars, coords=coords)
-        mock_load.return_value = mock_dataset
-        mock_plot.return_value = MagicMock()
-
         runner = CliRunner()
         result = runner.invoke(cli, ["plot", str(spec_file)])
 
         assert result.exit_code == 0
         assert f"Loading SPICE data from: {raw_file}" in result.output
-        mock_load.assert_called_once_with(raw_file)
-
-    @patch("yaml2plot.cli.load_spice_raw")
-    @patch("yaml2plot.cli.create_plot")
-    @patch("yaml2plot.cli.configure_plotly_renderer")
-    def test_positional_override_with_warning(
-        self, mock_configure, mock_plot, mock_load, tmp_path
-    ):
+        cli_mocks.assert_called_once_with(raw_file)
+
+    def test_positional_override_with_warning(self, cli_mocks, tmp_path):
         """Test positional argument overrides YAML raw: field with warning."""
         spec_file = tmp_path / "spec.yaml"
         yaml_raw_file = tmp_path / "yaml.raw"
@@ -92,13 +89,6 @@ y:
 """
         spec_file.write_text(spec_content)
 
-        # Mock the load function to return fake xarray Dataset
-        data_vars = {"v1": (["time"], np.array([1, 2, 3]))}
-        coords = {"time": np.array([1, 2, 3])}
-        mock_dataset = xr.Dataset(data_vars=data_vars, coords=coords)
-        mock_load.return_value = mock_dataset
-        mock_plot.return_value = MagicMock()
-
         runner = CliRunner()
         result = runner.invoke(cli, ["plot", str(spec_file), str(cli_raw_file)])
 
@@ -107,14 +97,9 @@ y:
         assert "CLI positional argument" in result.output
         assert "overrides YAML raw: field" in result.output
         assert f"Loading SPICE data from: {cli_raw_file}" in result.output
-        mock_load.assert_called_once_with(cli_raw_file)
-
-    @patch("yaml2plot.cli.load_spice_raw")
-    @patch("yaml2plot.cli.create_plot")
-    @patch("yaml2plot.cli.configure_plotly_renderer")
-    def test_raw_option_override_with_warning(
-        self, mock_configure, mock_plot, mock_load, tmp_path
-    ):
+        cli_mocks.assert_called_once_with(cli_raw_file)
+
+    def test_raw_option_override_with_warning(self, cli_mocks, tmp_path):
         """Test --raw option overrides both positional and YAML with warning."""
         spec_file = tmp_path / "spec.yaml"
         yaml_raw_file = tmp_path / "yaml.raw"
@@ -136,13 +121,6 @@ y:
 """
         spec_file.write_text(spec_content)
 
-        # Mock the load function to return fake xarray Dataset
-        data_vars = {"v1": (["time"], np.array([1, 2, 3]))}
-        coords = {"time": np.array([1, 2, 3])}
-        mock_dataset = xr.Dataset(data_vars=data_vars, coords=coords)
-        mock_load.return_value = mock_dataset
-        mock_plot.return_value = MagicMock()
-
         runner = CliRunner()
         result = runner.invoke(
             cli, ["plot", str(spec_file), str(pos_raw_file), "--raw", str(opt_raw_file)]
@@ -152,7 +130,7 @@ y:
         assert "Warning:" in result.output
         assert "CLI --raw option overrides" in result.output
         assert f"Loading SPICE data from: {opt_raw_file}" in result.output
-        mock_load.assert_called_once_with(opt_raw_file)
+        cli_mocks.assert_called_once_with(opt_raw_file)
 
     def test_no_raw_file_specified_error(self, tmp_path):
         """Test error when no raw file is specified anywhere."""
@@ -2,7 +2,6 @@ import pytest
 import xarray as xr
 import numpy as np
 from click.testing import CliRunner
-from unittest.mock import patch
 from yaml2plot.cli import cli
 
 
@@ -11,8 +10,7 @@ def runner():
     return CliRunner()
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_signals_all_option(mock_load_spice_raw, runner):
+def test_signals_all_option(serve_dataset, runner):
     """Test the 'signals' command with the -a/--all option."""
     # Arrange - Mock xarray Dataset
     data_vars = {f"v(sig{i})": (["time"], np.array([])) for i in range(20)}
@@ -20,7 +18,7 @@ def test_signals_all_option(mock_load_spice_raw, runner):
         data_vars=data_vars,
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -37,8 +35,7 @@ def test_signals_all_option(mock_load_spice_raw, runner):
         assert "..." not in result.output
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_signals_default_limit(mock_load_spice_raw, runner):
+def test_signals_default_limit(serve_dataset, runner):
     """Test the 'signals' command with the default limit."""
     # Arrange - Mock xarray Dataset
     data_vars = {f"v(sig{i})": (["time"], np.array([])) for i in range(20)}
@@ -46,7 +43,7 @@ def test_signals_default_limit(mock_load_spice_raw, runner):
         data_vars=data_vars,
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
@@ -64,8 +61,7 @@ def test_signals_default_limit(mock_load_spice_raw, runner):
         assert "... and 11 more signals" in result.output
 
 
-@patch("yaml2plot.cli.load_spice_raw")
-def test_signals_grep_option(mock_load_spice_raw, runner):
+def test_signals_grep_option(serve_dataset, runner):
     """Test the 'signals' command with the --grep option."""
     # Arrange - Mock xarray Dataset
     mock_dataset = xr.Dataset(
@@ -76,7 +72,7 @@ def test_signals_grep_option(mock_load_spice_raw, runner):
         },
         coords={"time": np.array([])}
     )
-    mock_load_spice_raw.return_value = mock_dataset
+    serve_dataset(mock_dataset)
 
     with runner.isolated_filesystem():
         with open("dummy.raw", "w") as f:
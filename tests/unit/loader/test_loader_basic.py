@@ -2,10 +2,44 @@ import numpy as np
 import pytest
 import xarray as xr
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from yaml2plot import loader as wv_loader
 
+# Signal data served by the mocked WaveDataset, built once at import as a
+# single contiguous buffer; each dict value is a zero-copy row view. The buffer
+# is read-only so a test can't mutate data the whole module shares.
+_SIGNAL_ROWS = np.array(
+    [
+        [0.0, 1e-9, 2e-9],
+        [0.0, 0.9, 1.8],
+        [1.8, 1.8, 1.8],
+    ]
+)
+_SIGNAL_ROWS.setflags(write=False)
+_SIGNALS = dict(zip(("time", "v(out)", "v(in)"), _SIGNAL_ROWS))
+
+
+class _FakeWaveDataset:
+    """Plain WaveDataset stand-in serving signals from a dict of arrays."""
+
+    def __init__(self, signals, metadata):
+        self._signals = signals
+        self.signals = list(signals)
+        self.metadata = metadata
+
+    def get_signal(self, name):
+        raise AssertionError("loader should batch via get_signals")
+
+    def get_signals(self, names):
+        return {name: self._signals[name] for name in names}
+
+
+@pytest.fixture(scope="module")
+def mock_wave_dataset():
+    """WaveDataset stand-in shared by the module; tests only read from it."""
+    return _FakeWaveDataset(_SIGNALS, {"analysis_type": "transient", "corner": "tt"})
+
 
 class TestValidateFilePath:
     def test_valid_path_returns_path_instance(self, tmp_path):
@@ -34,11 +68,8 @@ class TestValidateFilePath:
 
 class TestLoadSpiceRaw:
     def _mock_dataset(self):
-        mock_ds = MagicMock()
-        mock_ds.signals = ["time", "v(out)"]
-        mock_ds.metadata = {"corner": "tt"}
-        mock_ds.get_signal.side_effect = lambda name: np.array([0, 1, 2])
-        return mock_ds
+        ramp = np.array([0, 1, 2])
+        return _FakeWaveDataset({"time": ramp, "v(out)": ramp}, {"corner": "tt"})
 
     def test_happy_path_returns_data_and_metadata(self, tmp_path):
         f = tmp_path / "sig.raw"
@@ -99,28 +130,20 @@ class TestLoadSpiceRawBatch:
 
 class TestLoadSpiceRawXarray:
     """Test the new xarray Dataset API for load_spice_raw()."""
-    
-    def _mock_dataset(self):
-        mock_ds = MagicMock()
-        mock_ds.signals = ["time", "v(out)", "v(in)"]
-        mock_ds.metadata = {"analysis_type": "transient", "corner": "tt"}
-        mock_ds.get_signal.side_effect = lambda name: {
-            "time": np.array([0.0, 1e-9, 2e-9]),
-            "v(out)": np.array([0.0, 0.9, 1.8]),
-            "v(in)": np.array([1.8, 1.8, 1.8])
-        }[name]
-        return mock_ds
+
+    @pytest.fixture(autouse=True)
+    def _patch_from_raw(self, monkeypatch, mock_wave_dataset):
+        monkeypatch.setattr(
+            wv_loader.WaveDataset, "from_raw", lambda *args, **kwargs: mock_wave_dataset
+        )
 
     def test_returns_xarray_dataset(self, tmp_path):
         """Test that load_spice_raw returns an xarray Dataset."""
         f = tmp_path / "test.raw"
         f.write_text("dummy")
-        
-        with patch.object(
-            wv_loader.WaveDataset, "from_raw", return_value=self._mock_dataset()
-        ):
-            result = wv_loader.load_spice_raw(f)
-            
+
+        result = wv_loader.load_spice_raw(f)
+
         # Should return xarray Dataset, not tuple
         assert isinstance(result, xr.Dataset)
         
@@ -128,15 +151,12 @@ class TestLoadSpiceRawXarray:
         """Test Dataset structure when time is present as coordinate."""
         f = tmp_path / "test.raw"
         f.write_text("dummy")
-        
-        with patch.object(
-            wv_loader.WaveDataset, "from_raw", return_value=self._mock_dataset()
-        ):
-            ds = wv_loader.load_spice_raw(f)
-            
+
+        ds = wv_loader.load_spice_raw(f)
+
         # Check coordinates
         assert "time" in ds.coords
-        np.testing.assert_array_equal(ds.coords["time"].values, [0.0, 1e-9, 2e-9])
+        np.testing.assert_array_equal(ds.coords["time"].values, _SIGNALS["time"])
         
         # Check data variables (signals excluding coordinate)
         assert "v(out)" in ds.data_vars
@@ -144,8 +164,8 @@ class TestLoadSpiceRawXarray:
         assert "time" not in ds.data_vars  # time should be coordinate, not data var
         
         # Check data values
-        np.testing.assert_array_equal(ds["v(out)"].values, [0.0, 0.9, 1.8])
-        np.testing.assert_array_equal(ds["v(in)"].values, [1.8, 1.8, 1.8])
+        np.testing.assert_array_equal(ds["v(out)"].values, _SIGNALS["v(out)"])
+        np.testing.assert_array_equal(ds["v(in)"].values, _SIGNALS["v(in)"])
         
         # Check dimensions
         assert ds["v(out)"].dims == ("time",)
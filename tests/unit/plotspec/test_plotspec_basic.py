@@ -1,4 +1,5 @@
 import pytest
+from operator import itemgetter
 from pathlib import Path
 from yaml2plot.core.plotspec import PlotSpec
 
@@ -29,6 +30,20 @@ class TestPlotSpecFromYaml:
         assert spec.width == 800
         assert spec.height == 400
 
+    def test_repeated_parse_returns_independent_specs(self):
+        # Extra fields are stored as parsed, so this is where a shared cached
+        # parse result would leak between specs
+        yaml_str = (
+            "x: {signal: time}\n"
+            "y:\n  - label: V\n    signals: {Out: v(out)}\n"
+            "annotations: {note: original}\n"
+        )
+        first = PlotSpec.from_yaml(yaml_str)
+        first.annotations["note"] = "changed"
+
+        second = PlotSpec.from_yaml(yaml_str)
+        assert second.annotations == {"note": "original"}
+
     def test_invalid_yaml_raises_valueerror(self):
         bad_yaml = "title: [unbalanced braces"
         with pytest.raises(ValueError):
@@ -66,12 +81,30 @@ class TestPlotSpecRoundTrip:
         spec = PlotSpec.from_yaml(yaml_str)
         d = spec.to_dict()
 
-        # Core keys must exist
-        for key in ["title", "x", "y", "width", "height", "theme"]:
-            assert key in d
-
-        # YAML had no title so value should be None and preserved
-        assert d["title"] is None
+        # Core keys must exist with their defaults (YAML had no title, so it
+        # should be None and preserved); itemgetter raises KeyError if missing
+        keys = (
+            "title",
+            "width",
+            "height",
+            "theme",
+            "title_x",
+            "title_xanchor",
+            "show_legend",
+            "grid",
+            "show_rangeslider",
+        )
+        assert itemgetter(*keys)(d) == (
+            None,
+            None,
+            None,
+            "plotly",
+            0.5,
+            "center",
+            True,
+            True,
+            True,
+        )
         assert d["x"]["signal"] == "time"
         assert isinstance(d["y"], list) and len(d["y"]) == 1
         assert d["y"][0]["label"] == "Voltage"
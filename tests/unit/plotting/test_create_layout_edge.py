@@ -1,26 +1,30 @@
 import pytest
-import unittest
+from types import MappingProxyType
 
 from yaml2plot.core.plotting import create_layout
 
+# Configs shared by several tests; read-only so no test can leak changes
+_SINGLE_AXIS_CFG = MappingProxyType(
+    {
+        "x": {"signal": "time"},
+        "y": [{"label": "Voltage", "signals": {"Out": "v(out)"}}],
+    }
+)
 
-class TestCreateLayoutEdgeCases(unittest.TestCase):
+
+class TestCreateLayoutEdgeCases:
     """Edge-case verification for create_layout()."""
 
     def test_single_axis_defaults(self):
-        cfg = {
-            "x": {"signal": "time"},
-            "y": [{"label": "Voltage", "signals": {"Out": "v(out)"}}],
-        }
-        layout = create_layout(cfg)
+        layout = create_layout(_SINGLE_AXIS_CFG)
 
         # X-axis basic checks
-        self.assertEqual(layout["xaxis"]["title"], "time")
-        self.assertTrue(layout["xaxis"]["rangeslider"]["visible"])
+        assert layout["xaxis"]["title"] == "time"
+        assert layout["xaxis"]["rangeslider"]["visible"]
 
         # Y-axis occupies full domain
-        self.assertEqual(layout["yaxis"]["domain"], [0, 1])
-        self.assertEqual(layout["yaxis"]["title"], "Voltage")
+        assert layout["yaxis"]["domain"] == [0, 1]
+        assert layout["yaxis"]["title"] == "Voltage"
 
     def test_multi_axis_domain_order_and_gap(self):
         cfg = {
@@ -37,12 +41,12 @@ class TestCreateLayoutEdgeCases(unittest.TestCase):
         top_dom = layout["yaxis"]["domain"]
         bottom_dom = layout["yaxis2"]["domain"]
 
-        self.assertAlmostEqual(top_dom[1], 1.0)
+        assert top_dom[1] == pytest.approx(1.0)
         # bottom axis upper bound must be below top axis lower bound (gap)
-        self.assertLess(bottom_dom[1], top_dom[0])
+        assert bottom_dom[1] < top_dom[0]
         # grid flag propagated
-        self.assertFalse(layout["yaxis"]["showgrid"])
-        self.assertFalse(layout["yaxis2"]["showgrid"])
+        assert not layout["yaxis"]["showgrid"]
+        assert not layout["yaxis2"]["showgrid"]
 
     def test_log_scale_and_range_propagation(self):
         """Test that log scale and range are correctly propagated to layout."""
@@ -63,16 +67,16 @@ class TestCreateLayoutEdgeCases(unittest.TestCase):
         layout = create_layout(config)
 
         # Verify X-axis
-        self.assertEqual(layout["xaxis"]["type"], "log")
-        self.assertEqual(layout["xaxis"]["range"], [1e-9, 1e-6])
+        assert layout["xaxis"]["type"] == "log"
+        assert layout["xaxis"]["range"] == [1e-9, 1e-6]
 
         # Verify Y-axis 1
-        self.assertEqual(layout["yaxis"]["type"], "log")
-        self.assertEqual(layout["yaxis"]["range"], [0.1, 1.2])
+        assert layout["yaxis"]["type"] == "log"
+        assert layout["yaxis"]["range"] == [0.1, 1.2]
 
         # Verify Y-axis 2 (no specific settings)
-        self.assertEqual(layout["yaxis2"]["type"], "linear")
-        self.assertNotIn("range", layout["yaxis2"])
+        assert layout["yaxis2"]["type"] == "linear"
+        assert "range" not in layout["yaxis2"]
 
     def test_linear_scale_and_no_range(self):
         """Test that linear scale and no range are default."""
@@ -88,28 +92,36 @@ class TestCreateLayoutEdgeCases(unittest.TestCase):
         layout = create_layout(config)
 
         # Verify X-axis
-        self.assertEqual(layout["xaxis"]["type"], "linear")
-        self.assertNotIn("range", layout["xaxis"])
+        assert layout["xaxis"]["type"] == "linear"
+        assert "range" not in layout["xaxis"]
 
         # Verify Y-axes
-        self.assertEqual(layout["yaxis"]["type"], "linear")
-        self.assertNotIn("range", layout["yaxis"])
-        self.assertEqual(layout["yaxis2"]["type"], "linear")
-        self.assertNotIn("range", layout["yaxis2"])
+        assert layout["yaxis"]["type"] == "linear"
+        assert "range" not in layout["yaxis"]
+        assert layout["yaxis2"]["type"] == "linear"
+        assert "range" not in layout["yaxis2"]
 
     def test_disable_rangeslider(self):
-        cfg = {
-            "x": {"signal": "time"},
-            "y": [
-                {"label": "Voltage", "signals": {"Out": "v(out)"}},
-            ],
-            "show_rangeslider": False,
-        }
+        cfg = {**_SINGLE_AXIS_CFG, "show_rangeslider": False}
+        layout = create_layout(cfg)
+        assert not layout["xaxis"]["rangeslider"]["visible"]
+
+    @pytest.mark.parametrize(
+        "title_cfg, exp_x, exp_anchor",
+        [
+            ({}, 0.5, "center"),
+            ({"title_x": 0.0, "title_xanchor": "left"}, 0.0, "left"),
+            ({"title_x": 1.0, "title_xanchor": "right"}, 1.0, "right"),
+        ],
+        ids=["default_center", "left", "right"],
+    )
+    def test_title_alignment(self, title_cfg, exp_x, exp_anchor):
+        cfg = {**_SINGLE_AXIS_CFG, "title": "Aligned", **title_cfg}
         layout = create_layout(cfg)
-        self.assertFalse(layout["xaxis"]["rangeslider"]["visible"])
+        assert layout["title"] == {"text": "Aligned", "x": exp_x, "xanchor": exp_anchor}
 
 
-class TestSIEngineeringNotationEdgeCases(unittest.TestCase):
+class TestSIEngineeringNotationEdgeCases:
     """Tests for SI engineering notation applied to all axes."""
 
     def test_x_axis_always_uses_si_notation(self):
@@ -123,9 +135,9 @@ class TestSIEngineeringNotationEdgeCases(unittest.TestCase):
         layout = create_layout(config)
 
         # SI engineering notation should be enabled for all X-axes
-        self.assertEqual(layout["xaxis"]["exponentformat"], "SI")
-        self.assertEqual(layout["xaxis"]["type"], "log")
-        self.assertEqual(layout["xaxis"]["title"], "Frequency (Hz)")
+        assert layout["xaxis"]["exponentformat"] == "SI"
+        assert layout["xaxis"]["type"] == "log"
+        assert layout["xaxis"]["title"] == "Frequency (Hz)"
 
     def test_time_domain_x_axis_uses_si_notation(self):
         """Time domain X-axis should also use SI engineering notation."""
@@ -138,8 +150,8 @@ class TestSIEngineeringNotationEdgeCases(unittest.TestCase):
         layout = create_layout(config)
 
         # SI engineering notation should be enabled for all signals
-        self.assertEqual(layout["xaxis"]["exponentformat"], "SI")
-        self.assertEqual(layout["xaxis"]["title"], "Time (s)")
+        assert layout["xaxis"]["exponentformat"] == "SI"
+        assert layout["xaxis"]["title"] == "Time (s)"
 
     def test_y_axes_use_si_notation(self):
         """All Y-axes should use SI engineering notation."""
@@ -155,7 +167,7 @@ class TestSIEngineeringNotationEdgeCases(unittest.TestCase):
         layout = create_layout(config)
 
         # SI engineering notation should be enabled for all Y-axes
-        self.assertEqual(layout["yaxis"]["exponentformat"], "SI")
-        self.assertEqual(layout["yaxis2"]["exponentformat"], "SI")
-        self.assertEqual(layout["yaxis"]["title"], "Voltage (V)")
-        self.assertEqual(layout["yaxis2"]["title"], "Current (A)")
+        assert layout["yaxis"]["exponentformat"] == "SI"
+        assert layout["yaxis2"]["exponentformat"] == "SI"
+        assert layout["yaxis"]["title"] == "Voltage (V)"
+        assert layout["yaxis2"]["title"] == "Current (A)"
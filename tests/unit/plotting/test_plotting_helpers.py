@@ -1,5 +1,6 @@
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import pytest
 import xarray as xr
 from pathlib import Path
@@ -14,6 +15,21 @@ from yaml2plot.core.plotting import (
 )
 from yaml2plot.core.plotspec import PlotSpec
 
+# Read-only waveform data shared by the add_waveform tests
+_X = np.array([0.0, 1.0, 2.0])
+_Y = np.array([10.0, 11.0, 12.0])
+_X.setflags(write=False)
+_Y.setflags(write=False)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_default_template():
+    """Skip Plotly's default template merge; these tests never inspect styling."""
+    previous = pio.templates.default
+    pio.templates.default = "none"
+    yield
+    pio.templates.default = previous
+
 
 class TestCalculateYAxisDomains:
     """Tests for the _calculate_y_axis_domains helper."""
@@ -56,39 +72,60 @@ class TestConfigZoom:
     def test_zero_axes_returns_empty_dict(self):
         assert _config_zoom({}, 0) == {}
 
-    def test_zoom_settings_are_set_for_multiple_axes(self):
-        cfg = _config_zoom({}, 3)
+    @pytest.mark.parametrize(
+        "num_axes, y_keys",
+        [
+            (1, ["yaxis.fixedrange"]),
+            (3, ["yaxis.fixedrange", "yaxis2.fixedrange", "yaxis3.fixedrange"]),
+        ],
+        ids=["one_axis", "three_axes"],
+    )
+    def test_zoom_settings_are_set_for_every_axis(self, num_axes, y_keys):
+        cfg = _config_zoom({}, num_axes)
 
         # Basic keys present
         assert cfg["dragmode"] == "zoom"
         assert cfg["xaxis.fixedrange"] is False
 
         # yaxis.fixedrange entries for every axis
-        for idx in range(3):
-            axis_id = "yaxis" if idx == 0 else f"yaxis{idx + 1}"
-            assert cfg[f"{axis_id}.fixedrange"] is False
+        assert {key: cfg[key] for key in y_keys} == dict.fromkeys(y_keys, False)
 
 
 class TestAddWaveform:
     """Tests for add_waveform convenience wrapper."""
 
     def test_adds_trace_and_preserves_y_axis_assignment(self):
-        x = np.array([0, 1, 2])
-        y = np.array([10, 11, 12])
         fig = create_figure()
 
         # Add to the default axis first
-        add_waveform(fig, x, y, name="default")
+        add_waveform(fig, _X, _Y, name="default")
         assert len(fig.data) == 1
         assert fig.data[0].yaxis == "y"
 
         # Add to a secondary axis
-        add_waveform(fig, x, y, name="secondary", y_axis="y2", line_color="red")
+        add_waveform(fig, _X, _Y, name="secondary", y_axis="y2", line_color="red")
         assert len(fig.data) == 2
         assert fig.data[1].yaxis == "y2"
         # Extra kwargs should be forwarded (e.g. line color)
         assert fig.data[1].line.color == "red"
 
+    @pytest.mark.parametrize(
+        "y, expected",
+        [
+            (np.array([0.5, 1.5, 2.5]), [0.5, 1.5, 2.5]),
+            (np.array([1, 2, 3]), [1, 2, 3]),
+            (np.array([1 + 2j, 3 - 1j, 0 + 0j]), [1.0, 3.0, 0.0]),
+        ],
+        ids=["float", "int", "complex"],
+    )
+    def test_trace_data_is_real(self, y, expected):
+        """Complex signals are reduced to their real part; real data passes through."""
+        fig = create_figure()
+        add_waveform(fig, _X, y, name="sig")
+
+        assert not np.iscomplexobj(fig.data[0].y)
+        np.testing.assert_array_equal(fig.data[0].y, expected)
+
 
 class TestPlotFilePathHandling:
     """Test plot() function with file path input using xarray Dataset API."""
@@ -2,32 +2,39 @@
 Test both intuitive and legacy scale syntax support.
 """
 
-import unittest
+import pytest
 from yaml2plot.core.plotting import create_layout
 
-
-class TestScaleSyntax(unittest.TestCase):
-    """Test that axes support scale: 'log'."""
-
-    def test_x_axis_scale(self):
-        """Test X-axis scale setting."""
-        config = {"x": {"signal": "frequency", "scale": "log"}}
-        layout = create_layout(config)
-        self.assertEqual(layout["xaxis"]["type"], "log")
-
-    def test_y_axis_scale(self):
-        """Test Y-axis scale setting."""
-        y_spec = {"label": "Voltage", "signals": {"V": "v(out)"}, "scale": "log"}
-        config = {"x": {"signal": "time"}, "y": [y_spec]}
-        layout = create_layout(config)
-        self.assertEqual(layout["yaxis"]["type"], "log")
-
-    def test_default_linear_scale(self):
-        """Test that scale defaults to linear."""
-        config = {
+SCALE_CASES = [
+    # (config, expected X-axis type, expected Y-axis type or None)
+    ({"x": {"signal": "frequency", "scale": "log"}}, "log", None),
+    (
+        {
+            "x": {"signal": "time"},
+            "y": [{"label": "Voltage", "signals": {"V": "v(out)"}, "scale": "log"}],
+        },
+        "linear",
+        "log",
+    ),
+    (
+        {
             "x": {"signal": "time"},
             "y": [{"label": "V", "signals": {"V": "v(out)"}}],
-        }
-        layout = create_layout(config)
-        self.assertEqual(layout["xaxis"]["type"], "linear")
-        self.assertEqual(layout["yaxis"]["type"], "linear")
+        },
+        "linear",
+        "linear",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "config, x_type, y_type",
+    SCALE_CASES,
+    ids=["x_axis_log", "y_axis_log", "default_linear"],
+)
+def test_axis_scale(config, x_type, y_type):
+    """Axes support scale: 'log' and default to linear."""
+    layout = create_layout(config)
+    assert layout["xaxis"]["type"] == x_type
+    if y_type is not None:
+        assert layout["yaxis"]["type"] == y_type
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+# Trace served for every signal by FakeRawRead, built once and read-only so
+# datasets that cache it can share the same array safely
+_TRACE = np.array([0.0, 1.0, 2.0, 3.0])
+_TRACE.setflags(write=False)
+
+
+class FakeRawRead:
+    """Minimal stand-in for spicelib.RawRead that records trace reads."""
+
+    def __init__(self, names, trace):
+        self._names = names
+        self._trace = trace
+        self.opens = 0
+        self.names_calls = 0
+        self.trace_calls = []
+
+    def get_trace_names(self):
+        self.names_calls += 1
+        return self._names
+
+    def get_trace(self, name):
+        self.trace_calls.append(name)
+        return self._trace
+
+
+@pytest.fixture
+def make_dataset(monkeypatch):
+    """Factory returning ``(dataset, fake_raw)`` built via WaveDataset.from_raw."""
+    from yaml2plot.core.wavedataset import WaveDataset
+
+    def _make(signal_names, trace=_TRACE, **from_raw_kwargs):
+        fake = FakeRawRead(signal_names, trace)
+
+        def _open(path, *args, **kwargs):
+            fake.opens += 1
+            return fake
+
+        monkeypatch.setattr("yaml2plot.core.wavedataset.RawRead", _open)
+        return WaveDataset.from_raw("dummy.raw", **from_raw_kwargs), fake
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def shared_dataset():
+    """Read-only dataset shared by a module; don't assert on its call counts."""
+    from yaml2plot.core.wavedataset import WaveDataset
+
+    return WaveDataset(FakeRawRead(["time", "V(out)", "I(VDD)"], _TRACE))
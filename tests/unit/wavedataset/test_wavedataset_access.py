@@ -0,0 +1,125 @@
+import weakref
+
+import numpy as np
+import pytest
+
+
+class TestWaveDatasetSignalAccess:
+    """Tests for case-insensitive signal lookup on WaveDataset."""
+
+    def test_signals_are_lowercase(self, shared_dataset):
+        assert shared_dataset.signals == ["time", "v(out)", "i(vdd)"]
+
+    def test_signals_returns_independent_list(self, shared_dataset):
+        shared_dataset.signals.append("bogus")
+        assert "bogus" not in shared_dataset.signals
+
+    def test_get_signal_case_insensitive(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"])
+
+        signal_data = dataset.get_signal("v(OUT)")
+
+        assert isinstance(signal_data, np.ndarray)
+        assert signal_data.tolist() == [0.0, 1.0, 2.0, 3.0]
+        # Lookup goes through the original-case trace name
+        assert fake.trace_calls == ["V(out)"]
+
+    def test_case_duplicate_names_resolve_to_first(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)", "v(out)"])
+
+        dataset.get_signal("V(OUT)")
+
+        assert fake.trace_calls == ["V(out)"]
+        assert dataset.signals.count("v(out)") == 2
+
+    def test_get_signal_caches_array(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"])
+
+        first = dataset.get_signal("v(out)")
+        second = dataset.get_signal("V(OUT)")
+
+        assert first is second
+        assert fake.trace_calls == ["V(out)"]
+
+    def test_get_signals_reads_each_trace_once(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"])
+
+        result = dataset.get_signals(["time", "v(out)", "V(OUT)"])
+
+        assert list(result) == ["time", "v(out)", "V(OUT)"]
+        assert result["v(out)"] is result["V(OUT)"]
+        assert fake.trace_calls == ["time", "V(out)"]
+
+    def test_get_signal_into_out_buffer(self, make_dataset):
+        dataset, _ = make_dataset(["time", "V(out)"])
+        buf = np.empty(4)
+
+        result = dataset.get_signal("V(out)", out=buf)
+
+        assert result is buf
+        np.testing.assert_array_equal(buf, [0.0, 1.0, 2.0, 3.0])
+
+    @pytest.mark.parametrize(
+        "shape", [(2, 4), (3,)], ids=["two_dimensional", "wrong_length"]
+    )
+    def test_get_signal_rejects_mismatched_out_buffer(self, make_dataset, shape):
+        dataset, _ = make_dataset(["time", "V(out)"])
+
+        with pytest.raises(ValueError, match=r"expected \(4,\)"):
+            dataset.get_signal("V(out)", out=np.empty(shape))
+
+    def test_clear_cache_refetches_trace(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"])
+
+        dataset.get_signal("v(out)")
+        dataset.clear_cache()
+        dataset.get_signal("v(out)")
+
+        assert fake.trace_calls == ["V(out)", "V(out)"]
+
+    def test_trace_names_read_once(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"])
+
+        dataset.get_signal("v(out)")
+        dataset.has_signal("TIME")
+        _ = dataset.signals
+
+        assert fake.names_calls == 1
+
+    def test_instances_have_no_dict(self, shared_dataset):
+        assert not hasattr(shared_dataset, "__dict__")
+
+    def test_instances_support_weak_references(self, shared_dataset):
+        assert weakref.ref(shared_dataset)() is shared_dataset
+
+    @pytest.mark.parametrize(
+        "name, expected", [("time", True), ("V(OUT)", True), ("v(in)", False)]
+    )
+    def test_has_signal(self, shared_dataset, name, expected):
+        assert shared_dataset.has_signal(name) is expected
+
+
+class TestWaveDatasetLazyLoading:
+    """Tests for WaveDataset.from_raw(lazy=True)."""
+
+    def test_lazy_defers_read_until_access(self, make_dataset):
+        dataset, fake = make_dataset(["time", "V(out)"], lazy=True)
+        assert fake.opens == 0
+
+        assert dataset.signals == ["time", "v(out)"]
+        assert fake.opens == 1
+
+        dataset.get_signal("v(out)")
+        assert fake.opens == 1
+
+    def test_lazy_surfaces_missing_file_on_access(self, monkeypatch):
+        from yaml2plot.core.wavedataset import WaveDataset
+
+        def _missing(path, *args, **kwargs):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr("yaml2plot.core.wavedataset.RawRead", _missing)
+        dataset = WaveDataset.from_raw("missing.raw", lazy=True)
+
+        with pytest.raises(FileNotFoundError):
+            dataset.has_signal("time")
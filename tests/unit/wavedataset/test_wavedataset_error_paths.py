@@ -1,45 +1,61 @@
+import re
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+from yaml2plot.core.wavedataset import (
+    MAX_SIGNALS_TO_SHOW,
+    SignalNotFoundError,
+    WaveDataset,
+)
 
-from yaml2plot.core.wavedataset import WaveDataset, MAX_SIGNALS_TO_SHOW
+_RE_NOT_FOUND = re.compile(r"SPICE raw file not found: bad\.raw")
+_RE_READ_FAILED = re.compile(r"Failed to read SPICE raw file 'bad\.raw': boom")
 
 
 class TestWaveDatasetErrorPaths:
     """Additional tests that exercise WaveDataset edge/error cases."""
 
-    def _make_dataset_with_signals(self, signal_names):
-        """Helper that returns a WaveDataset instance with mocked RawRead."""
-        with patch("yaml2plot.core.wavedataset.RawRead") as mock_raw_read:
-            mock_raw = MagicMock()
-            mock_raw.get_trace_names.return_value = signal_names
-            mock_raw.get_trace.side_effect = lambda name: [0, 1, 2]  # dummy data
-            mock_raw_read.return_value = mock_raw
-            return WaveDataset.from_raw("dummy.raw")
-
-    def test_get_signal_missing_raises_valueerror(self):
+    def test_get_signal_missing_raises_valueerror(self, make_dataset):
         """get_signal() should raise ValueError with truncated signal list when missing."""
         # Create more signals than MAX_SIGNALS_TO_SHOW to test truncation logic
         signals = [f"sig{i}" for i in range(MAX_SIGNALS_TO_SHOW + 2)]
-        dataset = self._make_dataset_with_signals(signals)
+        dataset, _ = make_dataset(signals)
 
         with pytest.raises(ValueError) as excinfo:
             dataset.get_signal("nonexistent")
 
+        assert isinstance(excinfo.value, SignalNotFoundError)
+        assert excinfo.value.name == "nonexistent"
+        # Keep the full signal list out of args so repr() stays short
+        assert excinfo.value.args == ("nonexistent",)
         msg = str(excinfo.value)
         # It should list only the first MAX_SIGNALS_TO_SHOW signals
         for name in signals[:MAX_SIGNALS_TO_SHOW]:
             assert name.lower() in msg
         assert "..." in msg  # Ellipsis indicates truncation
 
-    def test_from_raw_file_not_found(self):
-        """from_raw() should propagate FileNotFoundError with custom message."""
-        with patch("yaml2plot.core.wavedataset.RawRead", side_effect=FileNotFoundError):
-            with pytest.raises(FileNotFoundError):
-                WaveDataset.from_raw("missing.raw")
-
-    def test_from_raw_generic_exception_wrapped(self):
-        """Any other exception from RawRead should be wrapped with informative message."""
-        with patch("yaml2plot.core.wavedataset.RawRead", side_effect=Exception("boom")):
-            with pytest.raises(Exception) as excinfo:
+    def test_signal_not_found_error_is_exported(self):
+        import yaml2plot
+
+        assert yaml2plot.SignalNotFoundError is SignalNotFoundError
+        assert "SignalNotFoundError" in yaml2plot.__all__
+
+    def test_missing_raw_data_raises_clear_error(self):
+        """Constructing without raw data fails up front with a clear message."""
+        with pytest.raises(ValueError, match="neither raw data nor a raw file path"):
+            WaveDataset(None)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        "raw_read_error, expected_exc, match",
+        [
+            (FileNotFoundError, FileNotFoundError, _RE_NOT_FOUND),
+            (Exception("boom"), Exception, _RE_READ_FAILED),
+        ],
+        ids=["file_not_found", "generic_exception_wrapped"],
+    )
+    def test_from_raw_errors(self, raw_read_error, expected_exc, match):
+        """from_raw() should re-raise RawRead errors with an informative message."""
+        with patch("yaml2plot.core.wavedataset.RawRead", side_effect=raw_read_error):
+            with pytest.raises(expected_exc, match=match):
                 WaveDataset.from_raw("bad.raw")
-        assert "boom" in str(excinfo.value)
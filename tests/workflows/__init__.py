@@ -0,0 +1 @@
+"""End-to-end workflow tests."""
@@ -0,0 +1,12 @@
+from functools import lru_cache
+from pathlib import Path
+
+import yaml2plot as y2p
+
+RING_OSC_RAW = Path("tests/raw_files/Ring_Oscillator_7stage.raw")
+
+
+@lru_cache(maxsize=None)
+def ring_osc_dataset():
+    """Ring oscillator dataset parsed once per process; treat as read-only."""
+    return y2p.load_spice_raw(RING_OSC_RAW)
@@ -1,7 +1,7 @@
 import unittest
 import yaml2plot as y2p
-from pathlib import Path
 import plotly.graph_objects as go
+from tests.workflows._ring_osc import ring_osc_dataset
 
 
 class TestPreloadWorkflow(unittest.TestCase):
@@ -9,9 +9,7 @@ class TestPreloadWorkflow(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        raw_file = Path("tests/raw_files/Ring_Oscillator_7stage.raw")
-        dataset = y2p.load_spice_raw(raw_file)
-        cls.dataset = dataset
+        cls.dataset = ring_osc_dataset()
 
     def test_first_plot(self):
         spec = y2p.PlotSpec.from_yaml(
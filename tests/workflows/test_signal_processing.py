@@ -4,11 +4,16 @@ import yaml2plot as y2p
 from pathlib import Path
 import plotly.graph_objects as go  # type: ignore
 from typing import Any
+from tests.workflows._ring_osc import ring_osc_dataset
 
 
 class TestSignalProcessingWorkflow(unittest.TestCase):
     """User story: load xarray Dataset, add derived signals, and plot."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.dataset = ring_osc_dataset()
+
     def test_ac_analysis_signal_processing(self):
         """Test AC analysis with magnitude and phase derived signals using clean xarray API."""
         # Use the actual AC analysis test file (complex signals)
@@ -83,8 +88,8 @@ class TestSignalProcessingWorkflow(unittest.TestCase):
         
     def test_frequency_domain_processing(self):
         """Test frequency domain signal processing with xarray Dataset."""
-        raw_file = Path("tests/raw_files/Ring_Oscillator_7stage.raw")
-        dataset = y2p.load_spice_raw(raw_file)
+        # Shallow copy so derived signals don't leak into the shared dataset
+        dataset = self.dataset.copy()
         
         # Simulate frequency domain processing
         time_signal = "v(bus07)"
@@ -3,6 +3,7 @@ import yaml2plot as y2p
 from pathlib import Path
 import plotly.graph_objects as go
 import tempfile
+from tests.workflows._ring_osc import ring_osc_dataset
 
 yaml_content = """
 title: "YAML Spec Workflow"
@@ -18,17 +19,18 @@ y:
 class TestYAMLSpecWorkflow(unittest.TestCase):
     """User story: load PlotSpec from YAML file and plot."""
 
-    def test_yaml_spec_plot(self):
-        raw_file = Path("tests/raw_files/Ring_Oscillator_7stage.raw")
-        dataset = y2p.load_spice_raw(raw_file)
+    @classmethod
+    def setUpClass(cls):
+        cls.dataset = ring_osc_dataset()
 
+    def test_yaml_spec_plot(self):
         with tempfile.NamedTemporaryFile("w", suffix=".yml", delete=False) as tmp:
             tmp.write(yaml_content)
             tmp_path = Path(tmp.name)
 
         try:
             spec = y2p.PlotSpec.from_yaml(tmp_path.read_text())
-            fig = y2p.plot(dataset, spec, show=False)
+            fig = y2p.plot(self.dataset, spec, show=False)
             self.assertIsInstance(fig, go.Figure)
         finally:
             tmp_path.unlink(missing_ok=True)